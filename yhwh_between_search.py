@@ -1,19 +1,21 @@
 from __future__ import annotations
 
 import os
-from collections import defaultdict
-from dataclasses import dataclass
+import re
+from collections import Counter
+from dataclasses import dataclass, field
+from functools import cached_property, lru_cache
+from itertools import compress, count, islice, repeat
+from operator import and_
 from pathlib import Path
-from typing import Any, Iterable, List, Optional, Sequence, Tuple
+from typing import Any, Callable, Dict, Iterable, List, Optional, Sequence, Tuple
 import subprocess
-import unicodedata
 
 from tf.fabric import Fabric
 
 BHSA_DATA_DIR = Path(__file__).resolve().parent / "bhsa" / "tf"
 BHSA_REPO_URL = "https://github.com/ETCBC/bhsa.git"
 DEFAULT_MODULE = os.environ.get("BHSA_MODULE", "2021")
-PROGRESS_INTERVAL = 50_000
 
 #Potent words?
 WORD_TO_SEARCH = "יהוה"
@@ -46,14 +48,19 @@ FINAL_FORM_TRANSLATION = str.maketrans(
     }
 )
 
+# Every nonspacing mark (category Mn) used in pointed Hebrew: cantillation, vowel
+# points, dagesh, shin/sin dots, plus the combining grapheme joiner.
+COMBINING_MARKS = re.compile("[\u034f\u0591-\u05bd\u05bf\u05c1\u05c2\u05c4\u05c5\u05c7]")
 
+
+@lru_cache(maxsize=None)
 def normalize_for_match(text: str) -> str:
     if not text:
         return ""
-    decomposed = unicodedata.normalize("NFD", text)
-    stripped = "".join(ch for ch in decomposed if unicodedata.category(ch) != "Mn")
-    normalized = unicodedata.normalize("NFC", stripped)
-    return normalized.translate(FINAL_FORM_TRANSLATION)
+    if text.isascii():
+        # No Hebrew marks or final letters to rewrite.
+        return text
+    return COMBINING_MARKS.sub("", text).translate(FINAL_FORM_TRANSLATION)
 
 
 @dataclass(frozen=True)
@@ -61,7 +68,12 @@ class WordSpan:
     nodes: Tuple[int, ...]
     consonantal: str
     pointed: str
-    reference: str
+    section_of: Callable[[int], Any] = field(repr=False, compare=False)
+
+    @cached_property
+    def reference(self) -> str:
+        # Section lookups are only paid for spans that are actually displayed.
+        return format_reference(self.section_of(self.nodes[0]))
 
 
 @dataclass(frozen=True)
@@ -69,6 +81,7 @@ class InterWordMatch:
     first: WordSpan
     second: WordSpan
     context: str
+    book: str
 
 
 def ensure_bhsa_repo() -> None:
@@ -168,6 +181,12 @@ def load_bhsa(module: str) -> Any:
     return api
 
 
+def _feature_lookup(feature: Any) -> Callable[[int], Optional[str]]:
+    # Bypass ``.v`` and read Text-Fabric's backing dict when it is exposed.
+    data = getattr(feature, "data", None)
+    return data.get if isinstance(data, dict) else feature.v
+
+
 def format_reference(section: Iterable | None) -> str:
     if not section:
         return "Unknown reference"
@@ -177,6 +196,7 @@ def format_reference(section: Iterable | None) -> str:
 
 def collect_matches(api) -> List[InterWordMatch]:
     F = api.F
+    L = api.L
     T = api.T
 
     word_nodes = F.otype.s("word")
@@ -189,68 +209,110 @@ def collect_matches(api) -> List[InterWordMatch]:
 
     matches: List[InterWordMatch] = []
 
-    def build_span(nodes: Sequence[int]) -> WordSpan:
-        node_tuple = tuple(nodes)
-        pointed = "".join(F.g_word_utf8.v(n) or "" for n in node_tuple)
-        consonantal = "".join(F.g_cons_utf8.v(n) or "" for n in node_tuple)
-        reference = format_reference(T.sectionFromNode(node_tuple[0]))
-        return WordSpan(nodes=node_tuple, consonantal=consonantal, pointed=pointed, reference=reference)
-
-    def second_span_nodes(start_index: int, prefix: str) -> Optional[Tuple[int, ...]]:
-        if not prefix:
-            return None
+    cons_value = _feature_lookup(F.g_cons_utf8)
+    word_value = _feature_lookup(F.g_word_utf8)
+    consonantal = [cons_value(node) or "" for node in word_nodes]
+    cons_norm = [normalize_for_match(cons) for cons in consonantal]
+    pointed = [word_value(node) or "" for node in word_nodes]
+
+    # Same English names that ``T.sectionFromNode`` puts in each reference.
+    book_of = ["Unknown"] * (max(word_nodes, default=0) + 1)
+    for book_node in F.otype.s("book"):
+        name = T.bookName(book_node)
+        for node in L.d(book_node, otype="word"):
+            book_of[node] = name
+
+    def build_span(start: int, stop: int) -> WordSpan:
+        return WordSpan(
+            nodes=tuple(word_nodes[start:stop]),
+            consonantal="".join(consonantal[start:stop]),
+            pointed="".join(pointed[start:stop]),
+            section_of=T.sectionFromNode,
+        )
 
-        nodes: List[int] = []
+    def second_span_end(start_index: int, prefix: str) -> Optional[int]:
         remaining = prefix
         idx = start_index
 
-        while idx < total_words and remaining:
-            node = word_nodes[idx]
-            cons = F.g_cons_utf8.v(node) or ""
-            norm = normalize_for_match(cons)
+        while idx < total_words:
+            norm = cons_norm[idx]
             if not norm:
                 return None
 
             if norm.startswith(remaining):
-                nodes.append(node)
-                remaining = ""
-                break
+                return idx + 1
 
             if remaining.startswith(norm):
-                nodes.append(node)
                 remaining = remaining[len(norm) :]
                 idx += 1
                 continue
 
             return None
 
-        return tuple(nodes) if not remaining else None
-
-    for idx, first_node in enumerate(word_nodes[:-1]):
-        if idx and idx % PROGRESS_INTERVAL == 0:
-            print(f"  Progress: {idx:,}/{total_words:,} words examined...")
+        return None
 
-        first_cons = F.g_cons_utf8.v(first_node) or ""
-        first_norm = normalize_for_match(first_cons)
-        if suffix_target and not first_norm.endswith(suffix_target):
-            continue
+    def second_span_ends(prefix: str) -> Dict[int, int]:
+        # Map every index where ``prefix`` begins, possibly across several
+        # words, to the index just past the words that spell it out.
+        if not prefix:
+            return {}
+
+        ends = {
+            idx: idx + 1
+            for idx in compress(count(), map(str.startswith, cons_norm, repeat(prefix)))
+        }
+        if len(prefix) == 2:
+            # Every suggested target splits into two letters, so specialize: the
+            # only multi-word span is the first letter standing alone followed
+            # by a word that starts with the second.
+            head, tail = prefix
+            for idx in compress(
+                count(),
+                map(
+                    and_,
+                    map(head.__eq__, cons_norm),
+                    map(str.startswith, islice(cons_norm, 1, None), repeat(tail)),
+                ),
+            ):
+                ends[idx] = idx + 2
+            return ends
+
+        # Only a word that is a leading piece of the prefix can start a multi-word span.
+        for idx in compress(count(), map(prefix.startswith, cons_norm)):
+            if idx not in ends:
+                end = second_span_end(idx, prefix)
+                if end is not None:
+                    ends[idx] = end
+        return ends
+
+    span_ends = second_span_ends(prefix_target)
+
+    # Only words ending in the suffix need to consult the span table.
+    first_hits = compress(
+        range(total_words - 1), map(str.endswith, cons_norm, repeat(suffix_target))
+    )
 
-        span_nodes = second_span_nodes(idx + 1, prefix_target)
+    for idx in first_hits:
+        span_end = span_ends.get(idx + 1)
 
-        if not span_nodes:
+        if span_end is None:
             continue
 
-        first_span = build_span([first_node])
-        second_span = build_span(span_nodes)
+        first_span = build_span(idx, idx + 1)
+        second_span = build_span(idx + 1, span_end)
 
-        span_length = len(span_nodes)
         context_start = max(idx - 3, 0)
-        context_end = min(idx + 1 + span_length + 3, total_words)
-        context_slice = word_nodes[context_start:context_end]
-        context_words = [F.g_word_utf8.v(node) or "" for node in context_slice]
-        context = " ".join(word for word in context_words if word).strip()
-
-        matches.append(InterWordMatch(first=first_span, second=second_span, context=context))
+        context_end = min(span_end + 3, total_words)
+        context = " ".join(word for word in pointed[context_start:context_end] if word).strip()
+
+        matches.append(
+            InterWordMatch(
+                first=first_span,
+                second=second_span,
+                context=context,
+                book=book_of[word_nodes[idx]],
+            )
+        )
 
     print(f"\nCompleted scanning. Found {len(matches)} matching pairs.\n")
     return matches
@@ -285,10 +347,7 @@ def display_results(matches: Sequence[InterWordMatch]) -> None:
 
 
 def summarize_by_book(matches: Sequence[InterWordMatch]) -> None:
-    summary = defaultdict(int)
-    for match in matches:
-        book = match.first.reference.split()[0]
-        summary[book] += 1
+    summary = Counter(match.book for match in matches)
 
     if not summary:
         return
@@ -307,7 +366,7 @@ def spotlight_song_of_songs(matches: Sequence[InterWordMatch]) -> None:
     filtered = [
         match
         for match in matches
-        if any(match.first.reference.startswith(title) for title in target_titles)
+        if any(match.book.startswith(title) for title in target_titles)
     ]
 
     if not filtered:
@@ -5,15 +5,25 @@ from __future__ import annotations
 import argparse
 import math
 import os
-import unicodedata
-from dataclasses import dataclass
+import pickle
+import re
+from array import array
+from collections import defaultdict
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+from functools import lru_cache
+from itertools import compress, count, repeat
 from pathlib import Path
-from typing import Any, Sequence
+from typing import Any, Callable, Iterable, Iterator, NamedTuple, Sequence
 
 from tf.fabric import Fabric
 
 ROOT = Path(__file__).resolve().parent
 BHSA_TF_DIR = ROOT / "bhsa" / "tf"
+CACHE_DIR = ROOT / ".cache"
+# Bump whenever what ``iter_words`` yields changes: the normalization in
+# ``strip_diacritics``/``normalize_for_match`` or the book labels.
+CACHE_VERSION = 2
 DEFAULT_MODULE = os.environ.get("BHSA_MODULE", "2021")
 DEFAULT_TARGET_WORD = os.environ.get("BHSA_TARGET_WORD", "יהוה")
 # DEFAULT_TARGET_WORD = os.environ.get("BHSA_TARGET_WORD", "שלומ")
@@ -29,27 +39,43 @@ FINAL_FORM_TRANSLATION = str.maketrans(
     }
 )
 
+# Every nonspacing mark (category Mn) used in pointed Hebrew: cantillation, vowel
+# points, dagesh, shin/sin dots, plus the combining grapheme joiner.
+COMBINING_MARKS = re.compile("[\u034f\u0591-\u05bd\u05bf\u05c1\u05c2\u05c4\u05c5\u05c7]")
 
+
+@lru_cache(maxsize=None)
 def normalize_for_match(text: str) -> str:
     """Strip vowel marks, cantillation, and letter-final variants for comparisons."""
     if not text:
         return ""
-    decomposed = unicodedata.normalize("NFD", text)
-    stripped = "".join(ch for ch in decomposed if unicodedata.category(ch) != "Mn")
-    normalized = unicodedata.normalize("NFC", stripped)
-    return normalized.translate(FINAL_FORM_TRANSLATION)
+    if text.isascii():
+        # No Hebrew marks or final letters to rewrite.
+        return text
+    return COMBINING_MARKS.sub("", text).translate(FINAL_FORM_TRANSLATION)
 
 
+# Words normalized here are cached on disk; bump CACHE_VERSION when this changes.
+@lru_cache(maxsize=None)
 def strip_diacritics(text: str) -> str:
     """Remove Hebrew vowel and cantillation marks, along with maqaf."""
     text = text.replace("\u05be", "")  # maqaf
     return normalize_for_match(text)
 
 
-@dataclass(frozen=True)
-class WordInfo:
-    text: str
-    book: str
+# Bit flags describing how a word form relates to the suffix/prefix targets.
+_SUFFIX = 1
+_PREFIX = 2
+_PARTIAL_PREFIX = 4
+# Set only for two-letter prefixes: the word starts with the prefix's second letter.
+_PREFIX_TAIL = 8
+
+
+class WordsTable(NamedTuple):
+    """Normalized corpus words stored column-wise, one entry per word."""
+
+    text: list[str]
+    book: list[str]
 
 
 @dataclass(frozen=True)
@@ -66,8 +92,72 @@ class PatternStats:
     p_value: float
 
 
-def load_words(module: str = DEFAULT_MODULE) -> tuple[Any, list[WordInfo]]:
-    """Load every word in the BHSA corpus along with its book metadata."""
+def _feature_lookup(feature: Any) -> Callable[[int], str | None]:
+    # Text-Fabric keeps node feature values in a plain ``data`` dict; reading it
+    # directly skips a method call per lookup. Fall back to ``.v`` in case a
+    # Text-Fabric release stops exposing it.
+    data = getattr(feature, "data", None)
+    return data.get if isinstance(data, dict) else feature.v
+
+
+def _cache_path(module: str) -> Path:
+    return CACHE_DIR / f"words_{module}.pkl"
+
+
+def _source_mtime(module: str) -> float | None:
+    try:
+        return (BHSA_TF_DIR / module).stat().st_mtime
+    except OSError:
+        return None
+
+
+def _read_words_cache(path: Path, source_mtime: float | None) -> WordsTable | None:
+    """Return the cached words, or None if the cache is missing, unreadable, or stale."""
+    try:
+        with path.open("rb") as handle:
+            columns = pickle.load(handle)
+        if (
+            columns["version"] != CACHE_VERSION
+            or columns["source_mtime"] != source_mtime
+        ):
+            return None
+        return WordsTable(text=list(columns["text"]), book=list(columns["book"]))
+    except (OSError, EOFError, KeyError, TypeError, pickle.UnpicklingError):
+        return None
+
+
+def _write_words_cache(path: Path, words: WordsTable, source_mtime: float | None) -> None:
+    columns = {
+        "version": CACHE_VERSION,
+        "source_mtime": source_mtime,
+        "text": words.text,
+        "book": words.book,
+    }
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with path.open("wb") as handle:
+            pickle.dump(columns, handle, protocol=pickle.HIGHEST_PROTOCOL)
+    except OSError as exc:
+        print(f"Warning: could not write word cache to {path}: {exc}")
+
+
+def load_words(
+    module: str = DEFAULT_MODULE, refresh_cache: bool = False
+) -> tuple[Any, WordsTable]:
+    """Load every word in the BHSA corpus along with its book metadata.
+
+    The normalized words are cached on disk per module and rebuilt when the
+    module directory or ``CACHE_VERSION`` changes; when they are served from
+    the cache the Text-Fabric API is not loaded and ``None`` is returned in
+    its place.
+    """
+    cache_path = _cache_path(module)
+    source_mtime = _source_mtime(module)
+    if not refresh_cache:
+        cached = _read_words_cache(cache_path, source_mtime)
+        if cached is not None:
+            return None, cached
+
     if not BHSA_TF_DIR.exists():
         raise SystemExit(
             f"BHSA Text-Fabric data not found at {BHSA_TF_DIR}. "
@@ -79,57 +169,131 @@ def load_words(module: str = DEFAULT_MODULE) -> tuple[Any, list[WordInfo]]:
     if not api:
         raise SystemExit("Failed to load BHSA Text-Fabric data.")
 
-    F = api.F
-    T = api.T
-    word_nodes = F.otype.s("word")
-    words: list[WordInfo] = []
-    for node in word_nodes:
-        raw = F.g_word_utf8.v(node) or ""
-        section = T.sectionFromNode(node)
-        book = section[0] if section else "Unknown"
-        words.append(WordInfo(text=strip_diacritics(raw), book=book))
-    return api, words
-
-
-def _suffix_flags(words: Sequence[WordInfo], suffix_target: str) -> list[bool]:
-    if not suffix_target:
-        return [True] * len(words)
-    return [word.text.endswith(suffix_target) for word in words]
-
-
-def _prefix_flags(words: Sequence[WordInfo], prefix_target: str) -> list[bool]:
-    total = len(words)
-    flags = [False] * total
-    if not prefix_target:
-        return flags
-
-    for start in range(total):
-        remaining = prefix_target
-        idx = start
-        matched = False
+    words = WordsTable(text=[], book=[])
+    for text, book in iter_words(api):
+        words.text.append(text)
+        words.book.append(book)
 
-        while idx < total and remaining:
-            segment = words[idx].text
-            if not segment:
-                break
-
-            if segment.startswith(remaining):
-                matched = True
-                remaining = ""
-                break
+    _write_words_cache(cache_path, words, source_mtime)
+    return api, words
 
-            if remaining.startswith(segment):
-                matched = True
-                remaining = remaining[len(segment) :]
-                idx += 1
-                continue
 
-            break
+def iter_words(api: Any) -> Iterator[tuple[str, str]]:
+    """Yield the normalized text and book of each BHSA word in corpus order.
 
-        if not remaining and matched:
-            flags[start] = True
+    The output is cached by ``load_words``; bump ``CACHE_VERSION`` when it changes.
+    """
+    F = api.F
+    L = api.L
+    T = api.T
+    word_nodes = F.otype.s("word")
 
-    return flags
+    # Label every word with its book in one sweep per book rather than asking
+    # Text-Fabric for the section of each word individually. ``T.bookName``
+    # gives the same (English) names as ``T.sectionFromNode``; ``F.book``
+    # holds the Latin ones.
+    book_of = ["Unknown"] * (max(word_nodes, default=0) + 1)
+    for book_node in F.otype.s("book"):
+        name = T.bookName(book_node)
+        for node in L.d(book_node, otype="word"):
+            book_of[node] = name
+
+    word_value = _feature_lookup(F.g_word_utf8)
+    for node in word_nodes:
+        yield strip_diacritics(word_value(node) or ""), book_of[node]
+
+
+class _FormIndex(dict):
+    """Assign consecutive ids to word forms in the order they are first seen."""
+
+    def __missing__(self, text: str) -> int:
+        index = self[text] = len(self)
+        return index
+
+
+@dataclass
+class _TrieNode:
+    children: dict[str, _TrieNode] = field(default_factory=dict)
+    ends: list[int] = field(default_factory=list)
+    deeper: list[int] = field(default_factory=list)
+
+
+def _build_trie(keys: Sequence[str]) -> _TrieNode:
+    """Index ``keys`` by position in a character trie."""
+    root = _TrieNode()
+    for index, key in enumerate(keys):
+        node = root
+        for ch in key:
+            node.deeper.append(index)
+            node = node.children.setdefault(ch, _TrieNode())
+        node.ends.append(index)
+    return root
+
+
+def _trie_walk(root: _TrieNode, chars: Iterable[str]) -> tuple[list[int], _TrieNode | None]:
+    """Return the keys that are prefixes of ``chars`` and the node where ``chars`` ends."""
+    matched = list(root.ends)
+    node = root
+    for ch in chars:
+        node = node.children.get(ch)
+        if node is None:
+            return matched, None
+        matched.extend(node.ends)
+    return matched, node
+
+
+def _form_codes(
+    forms: Sequence[str], targets: Sequence[tuple[str, str]]
+) -> list[bytearray]:
+    """Classify each distinct word form once against every (suffix, prefix) target.
+
+    Suffixes and prefixes are looked up in character tries, so each form is
+    walked once however many targets are being compared. Returns, per target,
+    one code byte for each form id.
+    """
+    suffix_trie = _build_trie([suffix[::-1] for suffix, _ in targets])
+    prefix_trie = _build_trie([prefix for _, prefix in targets])
+    two_letter = [k for k, (_, prefix) in enumerate(targets) if len(prefix) == 2]
+    codes = [bytearray(len(forms)) for _ in targets]
+
+    for form_id, text in enumerate(forms):
+        form = [0] * len(targets)
+        suffixes, _ = _trie_walk(suffix_trie, reversed(text))
+        for k in suffixes:
+            form[k] |= _SUFFIX
+        prefixes, last = _trie_walk(prefix_trie, text)
+        for k in prefixes:
+            if targets[k][1]:  # an empty prefix never matches
+                form[k] |= _PREFIX
+        if text and last is not None:
+            for k in last.deeper:
+                form[k] |= _PARTIAL_PREFIX
+        for k in two_letter:
+            if text.startswith(targets[k][1][1]):
+                form[k] |= _PREFIX_TAIL
+        for target_codes, code in zip(codes, form):
+            target_codes[form_id] = code
+
+    return codes
+
+
+def _prefix_continues(
+    forms: Sequence[str], ids: Sequence[int], start: int, remaining: str
+) -> bool:
+    """Check whether ``remaining`` is spelled out by the words from ``start`` onward."""
+    total = len(ids)
+    idx = start
+    while idx < total:
+        segment = forms[ids[idx]]
+        if not segment:
+            return False
+        if segment.startswith(remaining):
+            return True
+        if not remaining.startswith(segment):
+            return False
+        remaining = remaining[len(segment) :]
+        idx += 1
+    return False
 
 
 def _poisson_tail(observed: int, lam: float) -> float:
@@ -137,6 +301,12 @@ def _poisson_tail(observed: int, lam: float) -> float:
         return 0.0 if observed > 0 else 1.0
     if observed <= 0:
         return 1.0
+    try:
+        from scipy.stats import poisson
+    except ImportError:  # SciPy is optional; fall back to summing the series.
+        pass
+    else:
+        return float(poisson.sf(observed - 1, lam))
 
     term = math.exp(observed * math.log(lam) - lam - math.lgamma(observed + 1))
     tail = term
@@ -150,32 +320,71 @@ def _poisson_tail(observed: int, lam: float) -> float:
     return min(1.0, tail)
 
 
-def compute_pattern_stats(
+def _digit_table(flag: int) -> bytes:
+    """Translation table sending a code byte to ASCII '1' if ``flag`` is set, else '0'."""
+    return bytes(0x31 if code & flag else 0x30 for code in range(256))
+
+
+_SUFFIX_DIGITS = _digit_table(_SUFFIX)
+_PREFIX_DIGITS = _digit_table(_PREFIX)
+_PARTIAL_DIGITS = _digit_table(_PARTIAL_PREFIX)
+_PREFIX_TAIL_DIGITS = _digit_table(_PREFIX_TAIL)
+_PARTIAL_MASK = bytes(1 if code & _PARTIAL_PREFIX else 0 for code in range(256))
+
+
+def _bitset(digits: bytes | bytearray) -> int:
+    """Pack one ASCII '0'/'1' per word into an int whose bit ``i`` is word ``i``."""
+    return int(digits[::-1], 2)
+
+
+def _popcount(bits: int) -> int:
+    return bin(bits).count("1")
+
+
+def _count_pattern(
+    forms: Sequence[str], ids: Sequence[int], codes: bytearray, prefix_target: str
+) -> tuple[int, int, int]:
+    """Return the suffix, prefix, and adjacent-pair counts for one target."""
+    column = bytes(map(codes.__getitem__, ids))
+
+    if len(prefix_target) == 2:
+        # A two-letter prefix can only span words as its first letter standing
+        # alone followed by a word starting with the second, so the multi-word
+        # case reduces to one more shift-AND.
+        partial_bits = _bitset(column.translate(_PARTIAL_DIGITS))
+        tail_bits = _bitset(column.translate(_PREFIX_TAIL_DIGITS))
+        prefix_bits = _bitset(column.translate(_PREFIX_DIGITS)) | (
+            partial_bits & (tail_bits >> 1)
+        )
+    else:
+        prefix_digits = bytearray(column.translate(_PREFIX_DIGITS))
+        for idx in compress(count(), column.translate(_PARTIAL_MASK)):
+            # Slow path: a short word may open a prefix spread over several words.
+            if _prefix_continues(forms, ids, idx, prefix_target):
+                prefix_digits[idx] = 0x31
+        prefix_bits = _bitset(prefix_digits)
+
+    suffix_bits = _bitset(column.translate(_SUFFIX_DIGITS))
+    # Word i ends with the suffix and word i + 1 starts the prefix.
+    adjacent_bits = suffix_bits & (prefix_bits >> 1)
+
+    return _popcount(suffix_bits), _popcount(prefix_bits), _popcount(adjacent_bits)
+
+
+def _pattern_stats(
     scope: str,
-    words: Sequence[WordInfo],
-    suffix_target: str,
-    prefix_target: str,
+    total_words: int,
+    suffix_count: int,
+    prefix_count: int,
+    observed_adjacent: int,
 ) -> PatternStats:
-    """Summarize how frequently the suffix/prefix pattern appears."""
-    total_words = len(words)
     if total_words == 0:
         return PatternStats(scope, 0, 0, 0, 0.0, 0, 0.0, 0.0, math.inf, 1.0)
 
-    suffix_flags = _suffix_flags(words, suffix_target)
-    prefix_flags = _prefix_flags(words, prefix_target)
-
-    suffix_count = sum(suffix_flags)
-    prefix_count = sum(prefix_flags)
-
     probability_suffix = suffix_count / total_words
     probability_prefix = prefix_count / total_words
 
     expected_adjacent = (total_words - 1) * probability_suffix * probability_prefix
-    observed_adjacent = sum(
-        1
-        for idx in range(total_words - 1)
-        if suffix_flags[idx] and prefix_flags[idx + 1]
-    )
 
     ratio = observed_adjacent / expected_adjacent if expected_adjacent else math.inf
     p_value = _poisson_tail(observed_adjacent, expected_adjacent)
@@ -194,6 +403,70 @@ def compute_pattern_stats(
     )
 
 
+def compute_pattern_stats_many(
+    scope: str,
+    texts: Iterable[str],
+    targets: Sequence[tuple[str, str]],
+) -> list[PatternStats]:
+    """Summarize several (suffix, prefix) patterns over the same words.
+
+    ``texts`` is consumed once and kept only as a dictionary encoding: each
+    distinct form plus a 4-byte form id per word. Forms are classified against
+    all targets together; the counting pass then runs once per target.
+    """
+    index = _FormIndex()
+    ids = array("I", map(index.__getitem__, texts))
+    total_words = len(ids)
+    if total_words == 0:
+        return [_pattern_stats(scope, 0, 0, 0, 0) for _ in targets]
+
+    forms = list(index)
+    codes = _form_codes(forms, targets)
+    return [
+        _pattern_stats(
+            scope, total_words, *_count_pattern(forms, ids, target_codes, prefix)
+        )
+        for target_codes, (_, prefix) in zip(codes, targets)
+    ]
+
+
+def compute_pattern_stats(
+    scope: str,
+    texts: Iterable[str],
+    suffix_target: str,
+    prefix_target: str,
+) -> PatternStats:
+    """Summarize how frequently the suffix/prefix pattern appears."""
+    return compute_pattern_stats_many(scope, texts, [(suffix_target, prefix_target)])[0]
+
+
+def compute_stats_by_book(
+    words: WordsTable,
+    targets: Sequence[tuple[str, str]],
+    max_workers: int = 1,
+) -> dict[str, list[PatternStats]]:
+    """Compute pattern statistics for every book.
+
+    Each book takes milliseconds to count, so books are processed serially
+    unless ``max_workers`` asks for worker processes.
+    """
+    by_book: dict[str, list[str]] = defaultdict(list)
+    for text, book in zip(words.text, words.book):
+        by_book[book].append(text)
+
+    if max_workers <= 1:
+        results = map(
+            compute_pattern_stats_many, by_book.keys(), by_book.values(), repeat(targets)
+        )
+        return dict(zip(by_book, results))
+
+    with ProcessPoolExecutor(max_workers=max_workers) as executor:
+        results = executor.map(
+            compute_pattern_stats_many, by_book.keys(), by_book.values(), repeat(targets)
+        )
+        return dict(zip(by_book, results))
+
+
 def display_stats(stats: PatternStats, suffix_target: str, prefix_target: str) -> None:
     """Pretty-print a PatternStats record."""
     print(f"==== {stats.scope} ====")
@@ -213,6 +486,24 @@ def display_stats(stats: PatternStats, suffix_target: str, prefix_target: str) -
     print()
 
 
+def display_book_table(
+    stats: Sequence[PatternStats], suffix_target: str, prefix_target: str
+) -> None:
+    """Print one row of pattern statistics per book."""
+    print(f"==== Per-book breakdown: {suffix_target} … {prefix_target} ====")
+    print(
+        f"{'Book':20s} {'Words':>8s} {'Suffix':>7s} {'Prefix':>7s} "
+        f"{'Expected':>9s} {'Observed':>8s} {'Ratio':>7s} {'P-value':>9s}"
+    )
+    for row in stats:
+        print(
+            f"{row.scope:20s} {row.total_words:8,d} {row.suffix_count:7,d} "
+            f"{row.prefix_count:7,d} {row.expected_adjacent:9.4f} "
+            f"{row.observed_adjacent:8,d} {row.ratio:7.4f} {row.p_value:9.6f}"
+        )
+    print()
+
+
 def resolve_targets(
     word: str | None,
     suffix_target: str | None,
@@ -256,6 +547,16 @@ def resolve_targets(
     return resolved_suffix, resolved_prefix
 
 
+def _positive_int(value: str) -> int:
+    try:
+        number = int(value)
+    except ValueError:
+        number = 0
+    if number < 1:
+        raise argparse.ArgumentTypeError(f"must be a positive integer, got {value!r}")
+    return number
+
+
 def parse_args(argv: Sequence[str] | None = None) -> argparse.Namespace:
     """Create an argument parser for CLI use."""
     parser = argparse.ArgumentParser(
@@ -268,8 +569,10 @@ def parse_args(argv: Sequence[str] | None = None) -> argparse.Namespace:
     )
     parser.add_argument(
         "--word",
-        default=DEFAULT_TARGET_WORD,
-        help="Target Hebrew word used to infer suffix/prefix (default: %(default)s).",
+        nargs="+",
+        default=[DEFAULT_TARGET_WORD],
+        help="Target Hebrew word(s) used to infer suffix/prefix; several words are "
+        f"compared in one pass over the corpus (default: {DEFAULT_TARGET_WORD}).",
     )
     parser.add_argument(
         "--split-index",
@@ -298,53 +601,86 @@ def parse_args(argv: Sequence[str] | None = None) -> argparse.Namespace:
         action="store_true",
         help="Skip the book-level summary even if --book is provided.",
     )
+    parser.add_argument(
+        "--all-books",
+        action="store_true",
+        help="Also report the pattern statistics for every book.",
+    )
+    parser.add_argument(
+        "--jobs",
+        type=_positive_int,
+        default=1,
+        help="Worker processes for --all-books (default: %(default)s, i.e. serial).",
+    )
+    parser.add_argument(
+        "--refresh-cache",
+        action="store_true",
+        help=f"Reload words from Text-Fabric and rewrite the cache in {CACHE_DIR}.",
+    )
     return parser.parse_args(argv)
 
 
 def main(argv: Sequence[str] | None = None) -> int:
     args = parse_args(argv)
-    try:
-        suffix_target, prefix_target = resolve_targets(
-            word=args.word,
-            suffix_target=args.suffix,
-            prefix_target=args.prefix,
-            split_index=args.split_index,
+    if len(args.word) > 1 and (args.suffix or args.prefix):
+        raise SystemExit(
+            "--suffix-target/--prefix-target can only be used with a single --word."
         )
+    try:
+        targets = [
+            resolve_targets(
+                word=word,
+                suffix_target=args.suffix,
+                prefix_target=args.prefix,
+                split_index=args.split_index,
+            )
+            for word in args.word
+        ]
     except ValueError as exc:
         raise SystemExit(str(exc))
 
-    _, words = load_words(args.module)
-    overall_stats = compute_pattern_stats(
-        "BHSA (all books)", words, suffix_target, prefix_target
-    )
+    _, words = load_words(args.module, refresh_cache=args.refresh_cache)
+    overall_stats = compute_pattern_stats_many("BHSA (all books)", words.text, targets)
 
-    book_stats: PatternStats | None = None
+    book_stats: list[PatternStats | None] = [None] * len(targets)
     book_scope = None
     if not args.skip_book and args.book:
         book_scope = args.book
-        book_words = [word for word in words if word.book == book_scope]
-        if not book_words:
+        book_texts = compress(words.text, map(book_scope.__eq__, words.book))
+        scoped = compute_pattern_stats_many(book_scope, book_texts, targets)
+        if not scoped[0].total_words:
             print(f"Warning: book '{book_scope}' not found in the dataset; skipping.")
         else:
-            book_stats = compute_pattern_stats(
-                book_scope, book_words, suffix_target, prefix_target
+            book_stats = scoped
+
+    per_book: dict[str, list[PatternStats]] = {}
+    if args.all_books:
+        per_book = compute_stats_by_book(words, targets, max_workers=args.jobs)
+
+    for idx, (word, (suffix_target, prefix_target), overall, book) in enumerate(
+        zip(args.word, targets, overall_stats, book_stats)
+    ):
+        print(f"Pattern: {suffix_target} … {prefix_target} (source word: {word})\n")
+        display_stats(overall, suffix_target, prefix_target)
+        if book:
+            display_stats(book, suffix_target, prefix_target)
+        if per_book:
+            display_book_table(
+                [stats[idx] for stats in per_book.values()], suffix_target, prefix_target
             )
 
-    print(f"Pattern: {suffix_target} … {prefix_target} (source word: {args.word})\n")
-    display_stats(overall_stats, suffix_target, prefix_target)
-    if book_stats:
-        display_stats(book_stats, suffix_target, prefix_target)
-
     print("Summary:")
-    print(
-        f"In {overall_stats.scope}, randomness predicts ~{overall_stats.expected_adjacent:.4f} "
-        f"transitions; we observe {overall_stats.observed_adjacent} (p={overall_stats.p_value:.6f})."
-    )
-    if book_stats:
+    for word, overall, book in zip(args.word, overall_stats, book_stats):
+        label = f"[{word}] " if len(targets) > 1 else ""
         print(
-            f"In {book_stats.scope}, the expected count is ~{book_stats.expected_adjacent:.4f}, "
-            f"with {book_stats.observed_adjacent} observed (p={book_stats.p_value:.6f})."
+            f"{label}In {overall.scope}, randomness predicts ~{overall.expected_adjacent:.4f} "
+            f"transitions; we observe {overall.observed_adjacent} (p={overall.p_value:.6f})."
         )
+        if book:
+            print(
+                f"{label}In {book.scope}, the expected count is ~{book.expected_adjacent:.4f}, "
+                f"with {book.observed_adjacent} observed (p={book.p_value:.6f})."
+            )
 
     return 0
 